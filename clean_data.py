@@ -1,12 +1,36 @@
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import re
 import os
-from shapely.validation import make_valid
-from shapely.geometry import Point, box
+import pyogrio
+import shapely
+from shapely.geometry import Point
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 warnings.filterwarnings('ignore')
 
+_NUM_RE = re.compile(r'\d+\.?\d*')
+_INT_RE = re.compile(r'\d+')
+_NONNUM_RE = re.compile(r'[^\d.]')
+
+BLOCKFACE_COLUMNS = [
+    'OBJECTID',
+    'PARKING_CATEGORY',
+    'PARKING_SPACES',
+    'PARKING_TIME_LIMIT',
+    'TOTAL_SPACES',
+    'PAID_SPACES',
+    'UNRESTRICTED',
+    'WKD_RATE1',
+    'START_TIME_WKD',
+    'END_TIME_WKD',
+    'RPZ_ZONE',
+    'PEAK_HOUR',
+    'BLOCK_ID',
+    'SIDE'
+]
+
 
 class SeattleParkingCleaner:
     """Cleaner for Seattle parking datasets"""
@@ -18,102 +42,38 @@ class SeattleParkingCleaner:
         os.makedirs(raw_dir, exist_ok=True)
         os.makedirs(clean_dir, exist_ok=True)
     
-    def clean_blockface_comprehensive(self, filename='parking_categories.geojson'):
-        """Clean the comprehensive blockface dataset with all parking info"""   
+    def clean_blockface_comprehensive(self, filename='parking_categories.geojson', batch_size=None):
+        """Clean the comprehensive blockface dataset with all parking info
+        
+        Pass batch_size to read and clean the file in chunks of that many
+        features, which caps peak memory on regions larger than Seattle.
+        """   
+        self._check_batch_size(batch_size)
         try:
             filepath = os.path.join(self.raw_dir, filename)
-            df = gpd.read_file(filepath)
-            print(f"  ✓ Loaded {len(df)} features")
-
-            df = df[df.geometry.notna()]
-            df['geometry'] = df.geometry.apply(
-                lambda g: make_valid(g) if not g.is_valid else g
-            )
-            print(f"  ✓ Fixed geometries")
-
-            original_count = len(df)
-            df = df[
-                (df['PARKING_CATEGORY'].notna()) | 
-                (df['PARKING_SPACES'] > 0)
-            ]
-            print(f"  ✓ Filtered to {len(df)} segments with parking ({len(df)/original_count*100:.1f}%)")
-
-            df['category_std'] = df['PARKING_CATEGORY'].fillna('UNKNOWN').str.strip().str.upper()
-
-            category_mapping = {
-                'PAID PARKING': 'PAID',
-                'PAID': 'PAID',
-                'UNRESTRICTED': 'UNRESTRICTED',
-                'RESTRICTED': 'RESTRICTED',
-                'CARPOOL': 'CARPOOL',
-                'RPZ': 'PERMIT',
-                'TIME LIMIT': 'TIME_LIMITED',
-                'NO PARKING': 'NO_PARKING'
-            }
-            
-            df['category_clean'] = df['category_std'].map(category_mapping).fillna(df['category_std'])
-            print(f"  ✓ Standardized categories: {df['category_clean'].unique()}")
-
-            df['time_limit_minutes'] = df['PARKING_TIME_LIMIT'].apply(self._parse_time_limit)
-            print(f"  ✓ Parsed time limits")
-   
-            df['total_spaces'] = pd.to_numeric(df['TOTAL_SPACES'], errors='coerce').fillna(0).astype(int)
-            df['paid_spaces'] = pd.to_numeric(df['PAID_SPACES'], errors='coerce').fillna(0).astype(int)
-            df['unrestricted_spaces'] = pd.to_numeric(df['UNRESTRICTED'], errors='coerce').fillna(0).astype(int)
-            print(f"  ✓ Cleaned space counts")
-
-            df['weekday_rate'] = df['WKD_RATE1'].apply(self._clean_currency)
-            df['weekday_start'] = df['START_TIME_WKD'].apply(self._standardize_time)
-            df['weekday_end'] = df['END_TIME_WKD'].apply(self._standardize_time)
-            print(f"  ✓ Cleaned weekday pricing")
-
-            df['price_category'] = df['weekday_rate'].apply(self._categorize_price)
-
-            df['has_paid_parking'] = df['paid_spaces'] > 0
-            df['is_permit_zone'] = df['RPZ_ZONE'].notna()
-            df['is_peak_hour_restricted'] = df['PEAK_HOUR'].notna()
-            print(f"  ✓ Created boolean flags")
-            
-            df['parking_type'] = 'street'
-
-            df['block_id'] = df['BLOCK_ID'].fillna('')
-            df['side'] = df['SIDE'].fillna('').str.upper()
-            
-            print(f"  → Simplifying geometries...")
-            df['geometry'] = df.geometry.simplify(tolerance=0.00005, preserve_topology=True)
-            print(f"  ✓ Simplified geometries")
+            batches = []
+            for df in self._read_batches(filepath, batch_size, columns=BLOCKFACE_COLUMNS):
+                if batch_size is None:
+                    print(f"  ✓ Loaded {len(df)} features")
+                    batches.append(self._clean_blockface_batch(df))
+                else:
+                    batches.append(self._clean_blockface_batch(df, verbose=False))
+                    print(f"  ✓ Batch {len(batches)}: kept {len(batches[-1])} of {len(df)} features")
 
-            output_cols = [
-                'geometry',
-                'OBJECTID',
-                'parking_type',
-                'category_clean',
-                'time_limit_minutes',
-                'total_spaces',
-                'paid_spaces',
-                'unrestricted_spaces',
-                'weekday_rate',
-                'weekday_start',
-                'weekday_end',
-                'price_category',
-                'has_paid_parking',
-                'is_permit_zone',
-                'is_peak_hour_restricted',
-                'block_id',
-                'side'
-            ]
-            
-            df_clean = df[output_cols]
-            df_clean = df_clean.drop_duplicates(subset=['geometry'])
+            df_clean = pd.concat(batches, ignore_index=True)
+            for col in ['parking_type', 'category_clean', 'price_category', 'side']:
+                df_clean[col] = df_clean[col].astype('category')
+            wkb = shapely.to_wkb(df_clean.geometry.to_numpy())
+            df_clean = df_clean[~pd.Index(wkb).duplicated()]
             output_path = os.path.join(self.clean_dir, 'street_parking_detailed.geojson')
-            df_clean.to_crs('EPSG:4326').to_file(output_path, driver='GeoJSON')
+            self._write_geojson(df_clean, output_path)
             print(f"  ✓ Exported {len(df_clean)} features to street_parking_detailed.geojson")
             self._print_file_size(output_path)
             print(f"  → Creating overview dataset...")
             overview = self._create_parking_overview(df_clean)
             if overview is not None:
                 overview_path = os.path.join(self.clean_dir, 'street_parking_overview.geojson')
-                overview.to_file(overview_path, driver='GeoJSON')
+                self._write_geojson(overview, overview_path)
                 print(f"  ✓ Created overview with {len(overview)} grid cells")
                 self._print_file_size(overview_path)
             
@@ -134,33 +94,31 @@ class SeattleParkingCleaner:
             return None
         
         try:
-            df = gpd.read_file(filepath)
+            df = gpd.read_file(filepath, engine='pyogrio')
             print(f"  ✓ Loaded {len(df)} features")
 
             df = df[df.geometry.notna()]
-            df['geometry'] = df.geometry.apply(
-                lambda g: make_valid(g) if not g.is_valid else g
-            )
+            df['geometry'] = self._make_valid(df.geometry)
 
             rate_columns = [col for col in df.columns if 'RATE' in col.upper() or 'PRICE' in col.upper()]
             
             for col in rate_columns:
                 new_col = col.lower().replace(' ', '_')
-                df[new_col] = df[col].apply(self._clean_currency)
+                df[new_col] = self._clean_currencies(df[col])
             
             time_columns = [col for col in df.columns if 'START' in col.upper() or 'END' in col.upper()]
             
             for col in time_columns:
                 new_col = col.lower().replace(' ', '_') + '_std'
-                df[new_col] = df[col].apply(self._standardize_time)
+                df[new_col] = self._standardize_times(df[col])
 
             numeric_rates = [col for col in df.columns if 'rate' in col.lower() and df[col].dtype in ['float64', 'int64']]
             if numeric_rates:
                 df['avg_rate'] = df[numeric_rates].mean(axis=1)
                 df['price_category'] = df['avg_rate'].apply(self._categorize_price)
-            df['geometry'] = df.geometry.simplify(tolerance=0.0001, preserve_topology=True)
+            df['geometry'] = shapely.simplify(df.geometry.to_numpy(), tolerance=0.0001, preserve_topology=True)
             output_path = os.path.join(self.clean_dir, 'parking_tiers_clean.geojson')
-            df.to_crs('EPSG:4326').to_file(output_path, driver='GeoJSON')
+            self._write_geojson(df, output_path)
             
             print(f"  ✓ Exported {len(df)} features")
             self._print_file_size(output_path)
@@ -180,7 +138,7 @@ class SeattleParkingCleaner:
             return None
         
         try:
-            df = gpd.read_file(filepath)
+            df = gpd.read_file(filepath, engine='pyogrio')
             print(f"  ✓ Loaded {len(df)} features")
             
             df = df[df.geometry.notna()]
@@ -201,7 +159,7 @@ class SeattleParkingCleaner:
                     break
             
             if capacity_col:
-                df['capacity'] = df[capacity_col].apply(self._clean_capacity)
+                df['capacity'] = self._clean_capacities(df[capacity_col])
             hours_col = None
             for col in ['HOURS', 'OPERATING_HOURS', 'OPEN_HOURS']:
                 if col in df.columns:
@@ -229,7 +187,7 @@ class SeattleParkingCleaner:
             
             df_clean = df[output_cols]
             output_path = os.path.join(self.clean_dir, 'garages_clean.geojson')
-            df_clean.to_crs('EPSG:4326').to_file(output_path, driver='GeoJSON')
+            self._write_geojson(df_clean, output_path)
             
             print(f"  ✓ Exported {len(df_clean)} features")
             self._print_file_size(output_path)
@@ -240,8 +198,12 @@ class SeattleParkingCleaner:
             print(f"  ✗ Error: {e}")
             return None
     
-    def create_combined_dataset(self):
-        """Create a combined points dataset for quick overview"""
+    def create_combined_dataset(self, resolution=0.001):
+        """Create a combined points dataset for quick overview
+        
+        Points are thinned to one per parking type in each resolution-degree
+        grid cell, so dense areas are thinned and sparse ones keep their points.
+        """
         
         try:
             street_path = os.path.join(self.clean_dir, 'street_parking_detailed.geojson')
@@ -251,15 +213,15 @@ class SeattleParkingCleaner:
                 print("  ⊘ Street parking not found, skipping combined dataset")
                 return None
 
-            street = gpd.read_file(street_path)
+            street = gpd.read_file(street_path, engine='pyogrio')
             street_points = street.copy()
-            street_points['geometry'] = street_points.geometry.centroid
+            street_points['geometry'] = shapely.centroid(street.geometry.to_numpy())
 
             street_simple = street_points[['geometry', 'parking_type', 'category_clean', 
                                           'total_spaces', 'price_category']].copy()
             street_simple = street_simple.rename(columns={'category_clean': 'category'})
             if os.path.exists(garage_path):
-                garages = gpd.read_file(garage_path)
+                garages = gpd.read_file(garage_path, engine='pyogrio')
                 garage_simple = garages[['geometry', 'parking_type']].copy()
                 garage_simple['category'] = 'GARAGE'
                 if 'capacity' in garages.columns:
@@ -273,9 +235,15 @@ class SeattleParkingCleaner:
                 print("  ⊘ Garages not found, using only street parking")
 
             combined = gpd.GeoDataFrame(combined, crs='EPSG:4326')
-            combined_sample = combined.iloc[::3].copy()
+            combined = combined[combined.geometry.notna() & ~combined.geometry.is_empty]
+            cells = pd.DataFrame({
+                'parking_type': combined['parking_type'].to_numpy(),
+                'x': np.round(combined.geometry.x.to_numpy() / resolution).astype(np.int64),
+                'y': np.round(combined.geometry.y.to_numpy() / resolution).astype(np.int64)
+            })
+            combined_sample = combined[~cells.duplicated().to_numpy()].copy()
             output_path = os.path.join(self.clean_dir, 'parking_all_points.geojson')
-            combined_sample.to_file(output_path, driver='GeoJSON')
+            self._write_geojson(combined_sample, output_path)
             
             print(f"  ✓ Created combined dataset with {len(combined_sample)} points")
             self._print_file_size(output_path)
@@ -286,32 +254,159 @@ class SeattleParkingCleaner:
             print(f"  ✗ Error: {e}")
             return None
     
+    def _clean_blockface_batch(self, df, verbose=True):
+        """Clean one batch of blockface features down to the output columns"""
+        log = print if verbose else (lambda *args: None)
+        original_count = len(df)
+        df = df[
+            df.geometry.notna() & (
+                (df['PARKING_CATEGORY'].notna()) | 
+                (df['PARKING_SPACES'] > 0)
+            )
+        ]
+        log(f"  ✓ Filtered to {len(df)} segments with parking ({len(df)/original_count*100:.1f}%)")
+
+        df['geometry'] = self._make_valid(df.geometry)
+        log(f"  ✓ Fixed geometries")
+
+        category_mapping = {
+            'PAID PARKING': 'PAID',
+            'PAID': 'PAID',
+            'UNRESTRICTED': 'UNRESTRICTED',
+            'RESTRICTED': 'RESTRICTED',
+            'CARPOOL': 'CARPOOL',
+            'RPZ': 'PERMIT',
+            'TIME LIMIT': 'TIME_LIMITED',
+            'NO PARKING': 'NO_PARKING'
+        }
+        
+        categories = df['PARKING_CATEGORY'].fillna('UNKNOWN').astype('category')
+        lookup = {}
+        for raw in categories.cat.categories:
+            std = raw.strip().upper()
+            lookup[raw] = category_mapping.get(std, std)
+        df['category_clean'] = categories.map(lookup).astype('category')
+        log(f"  ✓ Standardized categories: {list(df['category_clean'].cat.categories)}")
+
+        df['time_limit_minutes'] = self._parse_time_limits(df['PARKING_TIME_LIMIT'])
+        log(f"  ✓ Parsed time limits")
+   
+        for src, dst in [('TOTAL_SPACES', 'total_spaces'), ('PAID_SPACES', 'paid_spaces'),
+                         ('UNRESTRICTED', 'unrestricted_spaces')]:
+            counts = pd.to_numeric(df[src], errors='coerce')
+            if counts.hasnans:
+                counts = counts.fillna(0)
+            df[dst] = counts.to_numpy().astype(np.int32, copy=False)
+        log(f"  ✓ Cleaned space counts")
+
+        df['weekday_rate'] = self._clean_currencies(df['WKD_RATE1'])
+        df['weekday_start'] = self._standardize_times(df['START_TIME_WKD'])
+        df['weekday_end'] = self._standardize_times(df['END_TIME_WKD'])
+        log(f"  ✓ Cleaned weekday pricing")
+
+        df['price_category'] = df['weekday_rate'].apply(self._categorize_price).astype('category')
+
+        df['has_paid_parking'] = df['paid_spaces'] > 0
+        df['is_permit_zone'] = df['RPZ_ZONE'].notna()
+        df['is_peak_hour_restricted'] = df['PEAK_HOUR'].notna()
+        log(f"  ✓ Created boolean flags")
+        
+        df['parking_type'] = pd.Series('street', index=df.index, dtype='category')
+
+        df['block_id'] = df['BLOCK_ID'].fillna('')
+        codes, sides = pd.factorize(df['SIDE'].fillna(''))
+        df['side'] = pd.Series(pd.Categorical(sides.str.upper()).take(codes), index=df.index)
+        
+        log(f"  → Simplifying geometries...")
+        df['geometry'] = shapely.simplify(df.geometry.to_numpy(), tolerance=0.00005, preserve_topology=True)
+        log(f"  ✓ Simplified geometries")
+
+        output_cols = [
+            'geometry',
+            'OBJECTID',
+            'parking_type',
+            'category_clean',
+            'time_limit_minutes',
+            'total_spaces',
+            'paid_spaces',
+            'unrestricted_spaces',
+            'weekday_rate',
+            'weekday_start',
+            'weekday_end',
+            'price_category',
+            'has_paid_parking',
+            'is_permit_zone',
+            'is_peak_hour_restricted',
+            'block_id',
+            'side'
+        ]
+        
+        return df[output_cols]
+    
+    def _read_batches(self, filepath, batch_size=None, columns=None):
+        """Yield the file as GeoDataFrames of at most batch_size features"""
+        self._check_batch_size(batch_size)
+        if batch_size is None:
+            yield gpd.read_file(filepath, engine='pyogrio', columns=columns)
+            return
+        
+        start = 0
+        while True:
+            batch = gpd.read_file(filepath, engine='pyogrio', columns=columns,
+                                  rows=slice(start, start + batch_size))
+            if len(batch) > 0:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            start += batch_size
+    
+    def _check_batch_size(self, batch_size):
+        """Reject batch sizes that would never advance through the file"""
+        if batch_size is None:
+            return
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be None or a positive int, got {batch_size!r}")
+    
     def _create_parking_overview(self, df, grid_size=0.005):
         """Create grid-based overview"""
         try:
+            df = df[df.geometry.notna() & ~df.geometry.is_empty]
+            centroids = shapely.centroid(df.geometry.to_numpy())
+            cx = shapely.get_x(centroids)
+            cy = shapely.get_y(centroids)
+            finite = np.isfinite(cx) & np.isfinite(cy)
+            df = df[finite]
+            cx = cx[finite]
+            cy = cy[finite]
+            
             minx, miny, maxx, maxy = df.total_bounds
-            import numpy as np
-            x_coords = np.arange(minx, maxx, grid_size)
-            y_coords = np.arange(miny, maxy, grid_size)
+            nx = max(1, int(np.ceil((maxx - minx) / grid_size)))
+            ny = max(1, int(np.ceil((maxy - miny) / grid_size)))
             
-            polygons = []
-            for x in x_coords:
-                for y in y_coords:
-                    polygons.append(box(x, y, x + grid_size, y + grid_size))
+            ix = ((cx - minx) / grid_size).astype(np.int32)
+            iy = ((cy - miny) / grid_size).astype(np.int32)
+            ix = np.minimum(ix, nx - 1)
+            iy = np.minimum(iy, ny - 1)
             
-            grid = gpd.GeoDataFrame({'geometry': polygons}, crs=df.crs)
-            joined = gpd.sjoin(grid, df, how='left', predicate='intersects')
-            aggregated = joined.groupby(joined.index).agg({
+            cells = pd.DataFrame({
+                'index': ix * ny + iy,
+                'total_spaces': df['total_spaces'].to_numpy(),
+                'paid_spaces': df['paid_spaces'].to_numpy(),
+                'has_paid_parking': df['has_paid_parking'].to_numpy()
+            })
+            aggregated = cells.groupby('index').agg({
                 'total_spaces': 'sum',
                 'paid_spaces': 'sum',
                 'has_paid_parking': 'any'
             }).reset_index()
+            aggregated['total_spaces'] = aggregated['total_spaces'].astype(int)
+            aggregated['paid_spaces'] = aggregated['paid_spaces'].astype(int)
+            aggregated = aggregated[aggregated['total_spaces'] > 0]
             
-            overview = grid.merge(aggregated, left_index=True, right_on='index', how='left')
-            overview['total_spaces'] = overview['total_spaces'].fillna(0).astype(int)
-            overview['paid_spaces'] = overview['paid_spaces'].fillna(0).astype(int)
-            overview['has_paid_parking'] = overview['has_paid_parking'].fillna(False)
-            overview = overview[overview['total_spaces'] > 0]
+            x0 = minx + (aggregated['index'].to_numpy() // ny) * grid_size
+            y0 = miny + (aggregated['index'].to_numpy() % ny) * grid_size
+            polygons = shapely.box(x0, y0, x0 + grid_size, y0 + grid_size)
+            overview = gpd.GeoDataFrame(aggregated, geometry=polygons, crs=df.crs)
             
             return overview
             
@@ -320,6 +415,15 @@ class SeattleParkingCleaner:
             return None
     
     # Helper methods
+    def _make_valid(self, geometry):
+        """Repair invalid geometries in one vectorized GEOS pass"""
+        arr = geometry.to_numpy()
+        invalid = ~shapely.is_valid(arr)
+        if invalid.any():
+            arr = arr.copy()
+            arr[invalid] = shapely.make_valid(arr[invalid])
+        return gpd.GeoSeries(arr, index=geometry.index, crs=geometry.crs)
+    
     def _parse_time_limit(self, time_str):
         """Parse time limit to minutes"""
         if pd.isna(time_str) or time_str == '':
@@ -329,27 +433,54 @@ class SeattleParkingCleaner:
         
         try:
             if 'hour' in time_str:
-                hours = float(re.findall(r'\d+\.?\d*', time_str)[0])
+                hours = float(_NUM_RE.findall(time_str)[0])
                 return int(hours * 60)
             elif 'min' in time_str:
-                return int(re.findall(r'\d+', time_str)[0])
-            elif time_str.isdigit():
-                return int(time_str)
+                return int(_INT_RE.findall(time_str)[0])
+            elif _NUM_RE.fullmatch(time_str):
+                return int(float(time_str))
         except:
             pass
         
         return None
     
+    def _parse_time_limits(self, series):
+        """Vectorized _parse_time_limit over a whole column"""
+        if pd.api.types.is_numeric_dtype(series):
+            minutes = np.floor(series.to_numpy(dtype='float64', na_value=np.nan))
+            minutes[~(minutes >= 0)] = np.nan
+            return pd.Series(minutes, index=series.index).astype('Int64')
+        
+        text = series.astype('string').str.lower().str.strip()
+        number = pd.to_numeric(
+            text.str.extract(r'(\d+\.?\d*)', expand=False), errors='coerce'
+        ).to_numpy(dtype='float64', na_value=np.nan)
+        is_hour = text.str.contains('hour', regex=False, na=False).to_numpy(dtype=bool)
+        is_min = text.str.contains('min', regex=False, na=False).to_numpy(dtype=bool)
+        is_bare = text.str.fullmatch(_NUM_RE, na=False).to_numpy(dtype=bool)
+        minutes = np.floor(np.where(is_hour, number * 60, number))
+        minutes[~(is_hour | is_min | is_bare)] = np.nan
+        return pd.Series(minutes, index=series.index).astype('Int64')
+    
     def _clean_currency(self, value):
         """Clean currency to float"""
         if pd.isna(value):
             return None
         try:
-            cleaned = re.sub(r'[^\d.]', '', str(value))
+            cleaned = _NONNUM_RE.sub('', str(value))
             return float(cleaned) if cleaned else None
         except:
             return None
     
+    def _clean_currencies(self, series):
+        """Vectorized _clean_currency over a whole column"""
+        if pd.api.types.is_numeric_dtype(series):
+            # _clean_currency strips the sign along with other non-digits
+            return series.astype('float64').abs()
+        
+        cleaned = series.astype('string').str.replace(_NONNUM_RE, '', regex=True)
+        return pd.to_numeric(cleaned.replace('', pd.NA), errors='coerce').astype('float64')
+    
     def _standardize_time(self, time_str):
         """Standardize to 24-hour format"""
         if pd.isna(time_str):
@@ -374,6 +505,17 @@ class SeattleParkingCleaner:
         
         return None
     
+    def _standardize_times(self, series):
+        """Vectorized _standardize_time over a whole column"""
+        text = series.astype('string').str.strip().str.upper()
+        result = pd.Series(pd.NA, index=series.index, dtype='string')
+        for fmt in ['%I:%M %p', '%I%p', '%I:%M%p']:
+            parsed = pd.to_datetime(text, format=fmt, errors='coerce')
+            result = result.fillna(parsed.dt.strftime('%H:%M').astype('string'))
+        has_colon = result.isna() & text.str.contains(':', regex=False, na=False)
+        result[has_colon] = text[has_colon].str.split().str[0]
+        return result
+    
     def _categorize_price(self, rate):
         """Categorize price"""
         if pd.isna(rate) or rate == 0:
@@ -390,11 +532,25 @@ class SeattleParkingCleaner:
         if pd.isna(value):
             return None
         try:
-            numbers = re.findall(r'\d+', str(value))
+            numbers = _INT_RE.findall(str(value))
             return int(numbers[0]) if numbers else None
         except:
             return None
     
+    def _clean_capacities(self, series):
+        """Vectorized _clean_capacity over a whole column"""
+        numbers = series.astype('string').str.extract(r'(\d+)', expand=False)
+        return pd.to_numeric(numbers, errors='coerce').astype('Int64')
+    
+    def _write_geojson(self, df, output_path):
+        """Write as RFC 7946 GeoJSON in EPSG:4326 with 6-decimal coordinates"""
+        if df.crs != 'EPSG:4326':
+            df = df.to_crs('EPSG:4326')
+        pyogrio.write_dataframe(
+            df, output_path, driver='GeoJSON',
+            layer_options={'COORDINATE_PRECISION': '6', 'RFC7946': 'YES'}
+        )
+    
     def _print_file_size(self, filepath):
         """Print file size"""
         size_mb = os.path.getsize(filepath) / (1024 * 1024)
@@ -403,8 +559,12 @@ class SeattleParkingCleaner:
         if size_mb > 5:
             print(f"    Warning: Large file may affect performance")
     
-    def verify_all_datasets(self):
-        """Verify all cleaned datasets"""
+    def verify_all_datasets(self, deep=False):
+        """Verify all cleaned datasets
+        
+        Only layer metadata is read by default; pass deep=True to also load
+        the geometries and check that they are valid.
+        """
         print("\n" + "=" * 70)
         print("VERIFICATION SUMMARY")
         print("=" * 70)
@@ -423,17 +583,21 @@ class SeattleParkingCleaner:
             filepath = os.path.join(self.clean_dir, filename)
             if os.path.exists(filepath):
                 try:
-                    gdf = gpd.read_file(filepath)
+                    info = pyogrio.read_info(filepath, force_feature_count=True)
                     size_mb = os.path.getsize(filepath) / (1024 * 1024)
                     total_size += size_mb
                     
                     print(f"\n{filename}:")
-                    print(f"  Features: {len(gdf)}")
-                    print(f"  CRS: {gdf.crs}")
-                    print(f"  Geometry: {gdf.geometry.type.unique()[0]}")
-                    print(f"  Valid: {gdf.geometry.is_valid.all()}")
+                    print(f"  Features: {info['features']}")
+                    print(f"  CRS: {info['crs']}")
+                    if deep:
+                        geometry = gpd.read_file(filepath, engine='pyogrio', columns=[]).geometry
+                        print(f"  Geometry: {geometry.type.unique()[0]}")
+                        print(f"  Valid: {geometry.is_valid.all()}")
+                    else:
+                        print(f"  Geometry: {info['geometry_type']}")
                     print(f"  Size: {size_mb:.2f} MB")
-                    cols = [c for c in gdf.columns if c != 'geometry'][:5]
+                    cols = list(info['fields'][:5])
                     print(f"  Key columns: {', '.join(cols)}")
                     
                 except Exception as e:
@@ -449,9 +613,14 @@ class SeattleParkingCleaner:
         """Run complete pipeline"""
         print("\nStarting data cleaning pipeline...\n")
         
-        self.clean_blockface_comprehensive()
-        self.clean_parking_tiers()
-        self.clean_garages()
+        steps = ['clean_blockface_comprehensive', 'clean_parking_tiers', 'clean_garages']
+        with ProcessPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [
+                executor.submit(_run_cleaner, self.raw_dir, self.clean_dir, step)
+                for step in steps
+            ]
+            for future in futures:
+                future.result()
         self.create_combined_dataset()
         
         self.verify_all_datasets()
@@ -468,6 +637,12 @@ class SeattleParkingCleaner:
         print("  • parking_all_points.geojson - Combined overview points")
 
 
+def _run_cleaner(raw_dir, clean_dir, step):
+    """Run one independent cleaning step in a worker process"""
+    cleaner = SeattleParkingCleaner(raw_dir=raw_dir, clean_dir=clean_dir)
+    getattr(cleaner, step)()
+
+
 def main():
     """Main execution"""
     cleaner = SeattleParkingCleaner(raw_dir='raw_data', clean_dir='assets')